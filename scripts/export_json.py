@@ -2,17 +2,32 @@
 # -*- coding: utf-8 -*-
 
 import csv
-import json
+import os
 from pathlib import Path
 
+import orjson
+
 OUT_DIR = Path("out")
 WEB_DATA = Path("docs/data")
 
-def read_csv(path: Path):
+def read_csv_columns(path: Path):
+    # csv.reader + zip(*rows) transposes to columns in C, without
+    # building a dict per row the way DictReader does. Ragged rows are
+    # padded with None (and cut to the header), as DictReader would, since
+    # zip() would otherwise truncate every column to the shortest row.
     with path.open("r", encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f))
+        reader = csv.reader(f)
+        header = next(reader, [])
+        width = len(header)
+        rows = [r if len(r) == width else (r + [None] * width)[:width]
+                for r in reader if r]
+    if not rows:
+        return {name: [] for name in header}
+    return dict(zip(header, map(list, zip(*rows))))
 
 def to_int(x, default=0):
+    if type(x) is str and x.isascii() and x.isdigit():
+        return int(x)
     try:
         s = str(x).strip().replace(" ", "")
         if s == "":
@@ -30,6 +45,57 @@ def to_float(x, default=0.0):
     except Exception:
         return default
 
+def to_str(x):
+    return (x or "").strip()
+
+# Frontend column types: field -> converter
+VIDEO_FIELDS = {
+    "view_count": to_int,
+    "like_count": to_int,
+    "duration_sec": to_int,
+    "duration_min": to_float,
+    "video_id": to_str,
+    "published_at": to_str,
+    "performer": to_str,
+}
+
+RATING_FIELDS = {
+    "rank": to_int,
+    "score": to_float,
+    "score_with_engagement": to_float,
+    "eng_mult": to_float,
+    "total_views": to_int,
+    "peak_views": to_int,
+    "video_count": to_int,
+    "total_minutes": to_float,
+    "total_likes": to_int,
+    "like_rate_pct": to_float,
+    "like_rate_smooth_pct": to_float,
+    "performer": to_str,
+}
+
+def normalize_columns(columns, fields):
+    # Convert column by column: one tight map() per field instead of
+    # dispatching every converter for every row.
+    n = len(next(iter(columns.values()), []))
+    for name, conv in fields.items():
+        columns[name] = list(map(conv, columns.get(name) or [None] * n))
+
+def write_json_records(path: Path, columns):
+    # Build each record only as it is encoded and write it straight into
+    # the file, so neither a list of dicts nor the whole document is held.
+    # Written to a temp file and renamed, so the site never sees a half file.
+    names = list(columns)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(b"[")
+        for i, values in enumerate(zip(*columns.values())):
+            if i:
+                f.write(b",")
+            f.write(orjson.dumps(dict(zip(names, values))))
+        f.write(b"]")
+    os.replace(tmp, path)
+
 def main():
     WEB_DATA.mkdir(parents=True, exist_ok=True)
 
@@ -41,36 +107,15 @@ def main():
     if not rating_path.exists():
         raise SystemExit(f"Missing: {rating_path}")
 
-    videos = read_csv(videos_path)
-    rating = read_csv(rating_path)
-
-    # Normalize video fields for frontend
-    for v in videos:
-        v["view_count"] = to_int(v.get("view_count"))
-        v["like_count"] = to_int(v.get("like_count"))
-        v["duration_sec"] = to_int(v.get("duration_sec"))
-        v["duration_min"] = to_float(v.get("duration_min"))
-        v["video_id"] = (v.get("video_id") or "").strip()
-        v["published_at"] = (v.get("published_at") or "").strip()
-        v["performer"] = (v.get("performer") or "").strip()
-
-    # Normalize rating fields for frontend
-    for r in rating:
-        r["rank"] = to_int(r.get("rank"))
-        r["score"] = to_float(r.get("score"))
-        r["score_with_engagement"] = to_float(r.get("score_with_engagement"))
-        r["eng_mult"] = to_float(r.get("eng_mult"))
-        r["total_views"] = to_int(r.get("total_views"))
-        r["peak_views"] = to_int(r.get("peak_views"))
-        r["video_count"] = to_int(r.get("video_count"))
-        r["total_minutes"] = to_float(r.get("total_minutes"))
-        r["total_likes"] = to_int(r.get("total_likes"))
-        r["like_rate_pct"] = to_float(r.get("like_rate_pct"))
-        r["like_rate_smooth_pct"] = to_float(r.get("like_rate_smooth_pct"))
-        r["performer"] = (r.get("performer") or "").strip()
-
-    (WEB_DATA / "videos.json").write_text(json.dumps(videos, ensure_ascii=False), encoding="utf-8")
-    (WEB_DATA / "rating.json").write_text(json.dumps(rating, ensure_ascii=False), encoding="utf-8")
+    videos = read_csv_columns(videos_path)
+    rating = read_csv_columns(rating_path)
+
+    # Normalize fields for frontend
+    normalize_columns(videos, VIDEO_FIELDS)
+    normalize_columns(rating, RATING_FIELDS)
+
+    write_json_records(WEB_DATA / "videos.json", videos)
+    write_json_records(WEB_DATA / "rating.json", rating)
 
     print("OK -> docs/data/videos.json")
     print("OK -> docs/data/rating.json")
@@ -1,14 +1,20 @@
 import os
 import re
+import sys
 import csv
-import json
 import time
-from dataclasses import dataclass
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple, Callable
+from operator import itemgetter
+from urllib.parse import urlencode
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Callable
 
+import orjson
 import requests
-from dateutil.parser import isoparse
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
 
@@ -19,16 +25,16 @@ from tqdm import tqdm
 API_KEY = os.getenv("YT_API_KEY")
 BASE_URL = "https://www.googleapis.com/youtube/v3"
 
+# Parallel videos.list batches per channel (quota is per project, not per connection)
+YT_WORKERS = 8
+# Channels fetched at the same time (each uses up to YT_WORKERS requests)
+YT_CHANNEL_WORKERS = 4
+
 CUTOFF_DATE = datetime(2022, 2, 24, tzinfo=timezone.utc)
 
 MIN_SEC = 4 * 60          # > 4 minutes
 MAX_SEC = 2 * 60 * 60     # < 2 hours (120 minutes)
 
-RE_TITLE_PODCAST = re.compile(r"(подкаст|підкаст|podcast)", re.IGNORECASE)
-RE_TITLE_IMPROV = re.compile(r"(імпровізаці\w*|improv\w*)", re.IGNORECASE)
-RE_TITLE_ROZGONY = re.compile(r"(розгони\w*|загони\w*)", re.IGNORECASE)
-RE_TITLE_HVYLYNA = re.compile(r"(хвилина\w*|уваги\w*)", re.IGNORECASE)
-
 BANNED_TITLE_PHRASES = [
     "я знаю де ти живеш",
     "МЕДИЧНІ ІСТОРІЇ",
@@ -36,17 +42,39 @@ BANNED_TITLE_PHRASES = [
     "ВЛОГ",
 ]
 
+# (reject_reason, pattern) in reporting priority order.
+# No trailing \w*: it never changes whether a title matches, and bare
+# literals cannot swallow a higher-priority hit inside the combined scan.
+TITLE_REJECT_PATTERNS = [
+    ("title_has_podcast", r"подкаст|підкаст|podcast"),
+    ("title_has_improv", r"імпровізаці|improv"),
+    ("title_has_rozgony", r"розгони|загони"),
+    ("title_has_hvylyna", r"хвилина|уваги"),
+] + [(f"banned_phrase:{p}", re.escape(p)) for p in BANNED_TITLE_PHRASES]
+
+# One regex pass decides every "title does NOT contain ..." rule;
+# group i+1 corresponds to TITLE_REJECT_PATTERNS[i].
+TITLE_REJECT_RE = re.compile(
+    "|".join(f"({pat})" for _, pat in TITLE_REJECT_PATTERNS),
+    re.IGNORECASE,
+)
+
 OUTPUT_DIR = "out"
 OUT_CSV = os.path.join(OUTPUT_DIR, "filtered_videos.csv")
 OUT_DEBUG_JSON = os.path.join(OUTPUT_DIR, "filtered_videos_debug.json")
 OUT_REJECTED_CSV = os.path.join(OUTPUT_DIR, "rejected_videos.csv")
 
+# On-disk API response cache for quick local reruns (0 disables).
+# View/like counts change daily, so entries expire instead of living forever.
+CACHE_DIR = os.path.join(OUTPUT_DIR, ".yt_cache")
+CACHE_TTL_SEC = int(os.getenv("YT_CACHE_TTL_SEC", str(6 * 60 * 60)))
+
 
 # =========================
 # MODELS
 # =========================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Video:
     video_id: str
     url: str
@@ -62,33 +90,153 @@ class Video:
     like_count: Optional[int]
     comment_count: Optional[int]
 
+    # casefolded title, computed once for the title rules
+    title_cf: str = field(repr=False)
+
+    @classmethod
+    def from_api(cls, it: Dict[str, Any]) -> "Video":
+        """Builds a Video from a videos.list item."""
+        sn = it["snippet"]
+        cd = it["contentDetails"]
+        st = it.get("statistics", {})
+
+        dur_sec = parse_duration(cd.get("duration", ""))
+        # RFC 3339 "YYYY-MM-DDTHH:MM:SSZ"; fromisoformat only accepts "Z" on 3.11+
+        published = datetime.fromisoformat(sn["publishedAt"].replace("Z", "+00:00"))
+        title = sn.get("title", "")
+
+        return cls(
+            video_id=it["id"],
+            url=f"https://www.youtube.com/watch?v={it['id']}",
+            # every video of a channel repeats these; share one string object
+            channel_id=sys.intern(sn["channelId"]),
+            channel_title=sys.intern(sn.get("channelTitle", "")),
+
+            title=title,
+            published_at=published,
+
+            duration_sec=dur_sec,
+
+            view_count=to_opt_int(st.get("viewCount")),
+            like_count=to_opt_int(st.get("likeCount")),
+            comment_count=to_opt_int(st.get("commentCount")),
+
+            title_cf=title.casefold(),
+        )
+
 
 # =========================
 # YT API HELPERS
 # =========================
 
+# One keep-alive connection pool for all API calls instead of a fresh
+# TLS handshake per request. Every call goes to one host, so a single
+# per-host pool; pool_maxsize is what covers the concurrent workers.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=YT_CHANNEL_WORKERS * YT_WORKERS))
+
+# Endpoint URLs with the API key already in the query string, so callers'
+# params go to requests as-is (no per-call copy + merge of the key).
+YT_URLS = {
+    name: f"{BASE_URL}/{name}?{urlencode({'key': API_KEY or ''})}"
+    for name in ("channels", "playlistItems", "videos")
+}
+
+def yt_cache_path(endpoint: str, params: Dict[str, Any]) -> str:
+    key = orjson.dumps([endpoint, sorted(params.items())])
+    return os.path.join(CACHE_DIR, hashlib.sha1(key).hexdigest() + ".json")
+
+
+def read_cache(path: str) -> Optional[Dict[str, Any]]:
+    if CACHE_TTL_SEC <= 0:
+        return None
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_TTL_SEC:
+            return None
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(path: str, data: Dict[str, Any]) -> None:
+    if CACHE_TTL_SEC <= 0:
+        return
+    # Unique temp name per writer: worker threads may fetch the same key at
+    # once. It's only a cache, so a failed write is skipped, not fatal.
+    tmp = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp, path)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
 def yt_get(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
     if not API_KEY:
         raise RuntimeError("Set YT_API_KEY environment variable first.")
-    params = dict(params)
-    params["key"] = API_KEY
-    r = requests.get(f"{BASE_URL}/{endpoint}", params=params, timeout=30)
+
+    cache_path = yt_cache_path(endpoint, params)
+    cached = read_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    r = SESSION.get(YT_URLS[endpoint], params=params, timeout=30)
     if r.status_code >= 400:
         print("YT ERROR", r.status_code, r.url)
         print(r.text[:2000])  # <- головне: причина тут
     r.raise_for_status()
-    return r.json()
+    data = orjson.loads(r.content)
+    write_cache(cache_path, data)
+    return data
 
 
 def parse_duration(d: str) -> int:
-    # ISO8601: PT#H#M#S
-    m = re.fullmatch(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?", d)
-    if not m:
+    # ISO8601: PT#H#M#S, scanned by hand: cheaper than a regex match + 3 int()
+    # on such short strings. Same as fullmatch(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+    # for ASCII digits: each unit at most once, in H, M, S order, with digits.
+    # Anything else (P0D, P1DT2H, PT1H1H, PT5S3M, ...) -> 0.
+    if not d.startswith("PT"):
+        return 0
+    total = n = 0
+    digits = False
+    last = 0  # rank of the last unit seen: H=1, M=2, S=3
+    for c in d[2:]:
+        if "0" <= c <= "9":
+            n = n * 10 + ord(c) - 48
+            digits = True
+            continue
+        if c == "H":
+            rank, mult = 1, 3600
+        elif c == "M":
+            rank, mult = 2, 60
+        elif c == "S":
+            rank, mult = 3, 1
+        else:
+            return 0
+        if not digits or rank <= last:
+            return 0
+        total += n * mult
+        n, digits, last = 0, False, rank
+    if digits:
         return 0
-    h = int(m.group(1) or 0)
-    mm = int(m.group(2) or 0)
-    s = int(m.group(3) or 0)
-    return h * 3600 + mm * 60 + s
+    return total
+
+
+def to_opt_int(x: Any) -> Optional[int]:
+    try:
+        if x is None:
+            return None
+        return int(x)
+    except Exception:
+        return None
 
 
 def resolve_channel_id(identifier: str) -> str:
@@ -150,60 +298,39 @@ def get_all_video_ids_from_uploads(playlist_id: str) -> List[str]:
         token = data.get("nextPageToken")
         if not token:
             break
-        time.sleep(0.05)
 
     return ids
 
 
-def get_videos_full(video_ids: List[str]) -> List[Video]:
-    videos: List[Video] = []
-    for i in range(0, len(video_ids), 50):
-        batch = video_ids[i:i+50]
-        data = yt_get("videos", {
-            "part": "snippet,contentDetails,statistics",
-            "id": ",".join(batch),
-            "maxResults": 50,
-        })
-
-        for it in data.get("items", []):
-            sn = it["snippet"]
-            cd = it["contentDetails"]
-            st = it.get("statistics", {})
-
-            dur_sec = parse_duration(cd.get("duration", ""))
-            published = isoparse(sn["publishedAt"])
-
-            def to_int(x: Any) -> Optional[int]:
-                try:
-                    if x is None:
-                        return None
-                    return int(x)
-                except Exception:
-                    return None
+def get_videos_batch(batch: List[str]) -> List[Dict[str, Any]]:
+    data = yt_get("videos", {
+        "part": "snippet,contentDetails,statistics",
+        "id": ",".join(batch),
+        "maxResults": 50,
+    })
+    return data.get("items", [])
 
-            videos.append(Video(
-                video_id=it["id"],
-                url=f"https://www.youtube.com/watch?v={it['id']}",
-                channel_id=sn["channelId"],
-                channel_title=sn.get("channelTitle", ""),
 
-                title=sn.get("title", ""),
-                published_at=published,
+def get_videos_full(video_ids: List[str]) -> List[Video]:
+    batches = [video_ids[i:i+50] for i in range(0, len(video_ids), 50)]
 
-                duration_sec=dur_sec,
+    # map() keeps batch order, so videos come back in playlist order
+    with ThreadPoolExecutor(max_workers=YT_WORKERS) as ex:
+        pages = list(ex.map(get_videos_batch, batches))
 
-                view_count=to_int(st.get("viewCount")),
-                like_count=to_int(st.get("likeCount")),
-                comment_count=to_int(st.get("commentCount")),
-            ))
+    return [Video.from_api(it) for items in pages for it in items]
 
-        time.sleep(0.05)
 
-    return videos
+def fetch_channel(identifier: str) -> Tuple[str, List[Video]]:
+    cid = resolve_channel_id(identifier)
+    uploads_id, channel_name = get_uploads_playlist(cid)
+    video_ids = get_all_video_ids_from_uploads(uploads_id)
+    return channel_name, get_videos_full(video_ids)
 
 
-def load_channel_exceptions(path="channel_exceptions.txt"):
-    exceptions = {}
+def load_channel_exceptions(path="channel_exceptions.txt") -> FrozenSet[Tuple[str, str]]:
+    """Returns a set of (channel_id, flag) pairs."""
+    exceptions = set()
     try:
         with open(path, encoding="utf-8") as f:
             for line in f:
@@ -211,10 +338,10 @@ def load_channel_exceptions(path="channel_exceptions.txt"):
                 if not line or line.startswith("#"):
                     continue
                 channel_id, flag = [x.strip() for x in line.split("|", 1)]
-                exceptions.setdefault(channel_id, set()).add(flag)
+                exceptions.add((channel_id, flag))
     except FileNotFoundError:
         pass
-    return exceptions
+    return frozenset(exceptions)
 
 
 # =========================
@@ -225,98 +352,118 @@ Rule = Callable[[Video], Tuple[bool, str]]  # (passed, reason_if_failed)
 
 STANDUP_KEYWORDS = ["стендап", "stand up", "standup"]
 
+# All keywords in one alternation: a single scan of the casefolded title
+# regardless of how many keywords there are.
+STANDUP_RE = re.compile("|".join(re.escape(kw.casefold()) for kw in STANDUP_KEYWORDS))
+
 CHANNEL_EXCEPTIONS = load_channel_exceptions()
 
+# Rule results are fixed for a given config: build them once at import
+# instead of formatting reason strings on every call.
+PASS = (True, "")
+FAIL_BEFORE_CUTOFF = (False, "before_2022_02_24")
+FAIL_TOO_SHORT = (False, f"too_short_<=_{MIN_SEC}s")
+FAIL_TOO_LONG = (False, f"too_long_>=_{MAX_SEC}s")
+FAIL_NO_STANDUP = (False, "no_standup_keyword")
+PASS_CHANNEL_EXCEPTION = (True, "channel_exception:standup_keyword")
+FAIL_TITLE_REJECTS = [(False, reason) for reason, _ in TITLE_REJECT_PATTERNS]
+
 def rule_after_cutoff(v: Video) -> Tuple[bool, str]:
-    return (True, "") if v.published_at >= CUTOFF_DATE else (False, "before_2022_02_24")
+    return PASS if v.published_at >= CUTOFF_DATE else FAIL_BEFORE_CUTOFF
 
 def rule_min_duration(v: Video) -> Tuple[bool, str]:
-    return (True, "") if v.duration_sec > MIN_SEC else (False, f"too_short_<=_{MIN_SEC}s")
+    return PASS if v.duration_sec > MIN_SEC else FAIL_TOO_SHORT
 
 def rule_max_duration(v: Video) -> Tuple[bool, str]:
-    return (True, "") if v.duration_sec < MAX_SEC else (False, f"too_long_>=_{MAX_SEC}s")
+    return PASS if v.duration_sec < MAX_SEC else FAIL_TOO_LONG
 
 def rule_title_has_standup(v: Video) -> Tuple[bool, str]:
-    channel_id = getattr(v, "channel_id", None)
-    if (
-        channel_id
-        and channel_id in CHANNEL_EXCEPTIONS
-        and "allow_without_standup_keyword" in CHANNEL_EXCEPTIONS[channel_id]
-    ):
-        return True, "channel_exception:standup_keyword"
-
-    title = (v.title or "").casefold()
-    for kw in STANDUP_KEYWORDS:
-        if kw in title:
-            return True, ""
-    return False, "no_standup_keyword"
-
-def rule_title_not_podcast(v: Video) -> Tuple[bool, str]:
-    return (False, "title_has_podcast") if RE_TITLE_PODCAST.search(v.title or "") else (True, "")
-
-def rule_title_not_improv(v: Video) -> Tuple[bool, str]:
-    return (False, "title_has_improv") if RE_TITLE_IMPROV.search(v.title or "") else (True, "")
-
-def rule_title_not_rozgony(v: Video) -> Tuple[bool, str]:
-    return (False, "title_has_rozgony") if RE_TITLE_ROZGONY.search(v.title or "") else (True, "")
-
-def rule_title_not_hvylyna(v: Video) -> Tuple[bool, str]:
-    return (False, "title_has_hvylyna") if RE_TITLE_HVYLYNA.search(v.title or "") else (True, "")
-
-def rule_no_banned_phrases(v: Video) -> Tuple[bool, str]:
-    title_cf = (v.title or "").casefold()
-    for phrase in BANNED_TITLE_PHRASES:
-        if phrase.casefold() in title_cf:
-            return False, f"banned_phrase:{phrase}"
-    return True, ""
+    if (v.channel_id, "allow_without_standup_keyword") in CHANNEL_EXCEPTIONS:
+        return PASS_CHANNEL_EXCEPTION
+
+    return PASS if STANDUP_RE.search(v.title_cf) else FAIL_NO_STANDUP
+
+def rule_title_rejects(v: Video) -> Tuple[bool, str]:
+    title = v.title or ""
+    # common case: no hit, one search and done
+    if not TITLE_REJECT_RE.search(title):
+        return PASS
+    hits = [m.lastindex for m in TITLE_REJECT_RE.finditer(title)]
+    return FAIL_TITLE_REJECTS[min(hits) - 1]
 
 RULES: List[Rule] = [
     rule_after_cutoff,
     rule_min_duration,
     rule_max_duration,
     rule_title_has_standup,
-    rule_title_not_podcast,
-    rule_title_not_improv,
-    rule_title_not_rozgony,
-    rule_title_not_hvylyna,
-    rule_no_banned_phrases,
+    rule_title_rejects,
 ]
 
-def apply_rules(v: Video, rules: List[Rule]) -> Tuple[bool, List[str]]:
-    for r in rules:
-        ok, reason = r(v)
-        if not ok:
-            return False, [reason]
-    return True, []
+def filter_videos(videos: List[Video], rules: List[Rule]) -> Tuple[List[Video], List[Tuple[Video, str]]]:
+    """
+    Applies rules one at a time over the whole batch, mask-style: each rule
+    only sees the videos that passed every previous rule, so the cheap
+    date/duration checks thin the batch before any title scanning.
+
+    Returns accepted videos and (video, reject_reason) pairs, both in input order.
+    """
+    # Failures are recorded explicitly: a rule may fail with an empty reason.
+    failed: List[Tuple[int, str]] = []
+    pending = list(range(len(videos)))
+    for rule in rules:
+        passed: List[int] = []
+        for i in pending:
+            ok, reason = rule(videos[i])
+            if ok:
+                passed.append(i)
+            else:
+                failed.append((i, reason))
+        pending = passed
+
+    failed.sort(key=itemgetter(0))
+    accepted = [videos[i] for i in pending]
+    rejected = [(videos[i], reason) for i, reason in failed]
+    return accepted, rejected
 
 
 # =========================
 # EXPORT
 # =========================
 
-def export_csv(path: str, items: List[Dict[str, Any]]) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    fields = [
-        "published_at","channel_title","channel_id","title",
-        "duration_sec","duration_min","view_count","like_count",
-        "comment_count","url","video_id",
-    ]
-    with open(path, "w", encoding="utf-8-sig", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
-        w.writeheader()
-        w.writerows(items)
-
-def export_rejected_csv(path: str, items: List[Dict[str, Any]]) -> None:
+CSV_FIELDS = [
+    "published_at","channel_title","channel_id","title",
+    "duration_sec","duration_min","view_count","like_count",
+    "comment_count","url","video_id",
+]
+REJECTED_CSV_FIELDS = CSV_FIELDS + ["reject_reason"]
+
+# Rows are plain tuples in CSV_FIELDS order: no per-video dict, and
+# csv.writer can emit them without DictWriter's per-field lookups.
+Row = Tuple[Any, ...]
+
+def video_row(v: Video) -> Row:
+    return (
+        v.published_at.isoformat(),
+        v.channel_title,
+        v.channel_id,
+        v.title,
+        v.duration_sec,
+        round(v.duration_sec / 60.0, 2),
+        v.view_count if v.view_count is not None else "",
+        v.like_count if v.like_count is not None else "",
+        v.comment_count if v.comment_count is not None else "",
+        v.url,
+        v.video_id,
+    )
+
+def export_csv(path: str, fields: List[str], rows: List[Row]) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    fields = [
-        "published_at","channel_title","channel_id","title",
-        "duration_sec","duration_min","view_count","like_count",
-        "comment_count","url","video_id","reject_reason",
-    ]
-    with open(path, "w", encoding="utf-8-sig", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
-        w.writeheader()
-        w.writerows(items)
+    # 1 MiB buffer: tens of thousands of rejected rows in a handful of writes.
+    # utf-8-sig only emits the BOM once, at the start of the stream.
+    with open(path, "w", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(fields)
+        w.writerows(rows)
 
 
 # =========================
@@ -327,48 +474,31 @@ def main() -> None:
     with open("channels.txt", encoding="utf-8") as f:
         channel_inputs = [l.strip() for l in f if l.strip() and not l.strip().startswith("#")]
 
-    accepted_rows: List[Dict[str, Any]] = []
-    rejected_rows: List[Dict[str, Any]] = []
-
-    for ch in channel_inputs:
-        cid = resolve_channel_id(ch)
-        uploads_id, channel_name = get_uploads_playlist(cid)
-
-        video_ids = get_all_video_ids_from_uploads(uploads_id)
-        videos = get_videos_full(video_ids)
-
-        for v in tqdm(videos, desc=f"Filter: {channel_name}"):
-            ok, reasons = apply_rules(v, RULES)
-
-            row = {
-                "published_at": v.published_at.isoformat(),
-                "channel_title": v.channel_title,
-                "channel_id": v.channel_id,
-                "title": v.title,
-                "duration_sec": v.duration_sec,
-                "duration_min": round(v.duration_sec / 60.0, 2),
-                "view_count": v.view_count if v.view_count is not None else "",
-                "like_count": v.like_count if v.like_count is not None else "",
-                "comment_count": v.comment_count if v.comment_count is not None else "",
-                "url": v.url,
-                "video_id": v.video_id,
-            }
+    accepted_rows: List[Row] = []
+    rejected_rows: List[Row] = []
 
-            if ok:
-                accepted_rows.append(row)
-            else:
-                rej = dict(row)
-                rej["reject_reason"] = ";".join(reasons)
-                rejected_rows.append(rej)
+    # Channels are independent: overlap their API round trips. map() still
+    # yields them in channels.txt order, so the output order is unchanged.
+    with ThreadPoolExecutor(max_workers=YT_CHANNEL_WORKERS) as ex:
+        fetched = ex.map(fetch_channel, channel_inputs)
+        for channel_name, videos in tqdm(fetched, total=len(channel_inputs), desc="Channels"):
+            accepted, rejected = filter_videos(videos, RULES)
+            tqdm.write(f"{channel_name}: accepted {len(accepted)}, rejected {len(rejected)}")
+
+            accepted_rows.extend(video_row(v) for v in accepted)
+            rejected_rows.extend(video_row(v) + (reason,) for v, reason in rejected)
 
-    accepted_rows.sort(key=lambda x: x["published_at"], reverse=True)
+    # Newest first by published_at. Each channel's uploads arrive already
+    # (almost) newest-first, and Timsort merges those runs natively, which
+    # is several times faster here than a heapq.merge of per-channel lists.
+    accepted_rows.sort(key=itemgetter(0), reverse=True)
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    export_csv(OUT_CSV, accepted_rows)
-    export_rejected_csv(OUT_REJECTED_CSV, rejected_rows)
+    export_csv(OUT_CSV, CSV_FIELDS, accepted_rows)
+    export_csv(OUT_REJECTED_CSV, REJECTED_CSV_FIELDS, rejected_rows)
 
-    with open(OUT_DEBUG_JSON, "w", encoding="utf-8") as f:
-        json.dump({
+    with open(OUT_DEBUG_JSON, "wb") as f:
+        f.write(orjson.dumps({
             "criteria_order": [
                 "published_at >= 2022-02-24",
                 "duration > 4 min",
@@ -381,8 +511,8 @@ def main() -> None:
                 "title does NOT contain banned phrases",
             ],
             "counts": {"accepted": len(accepted_rows), "rejected": len(rejected_rows)},
-            "rejected_sample": rejected_rows[:200],
-        }, f, ensure_ascii=False, indent=2)
+            "rejected_sample": [dict(zip(REJECTED_CSV_FIELDS, r)) for r in rejected_rows[:200]],
+        }, option=orjson.OPT_INDENT_2))
 
     print("✅ Done")
     print(f"Accepted CSV: {OUT_CSV}")
@@ -38,8 +38,10 @@ import csv
 import math
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple
 
 
 # ---------- Config ----------
@@ -73,13 +75,16 @@ ENG_MULT_CLAMP = (0.85, 1.15)
 # ---------- Helpers ----------
 
 _YT_ID_RE = re.compile(r"(?:v=|/shorts/|youtu\.be/)([A-Za-z0-9_-]{11})")
+_YT_ID11_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+_ISO_DUR_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+_WS_RE = re.compile(r"\s+")
 
 
 def extract_video_id(url_or_id: str) -> Optional[str]:
     s = (url_or_id or "").strip()
     if not s:
         return None
-    if re.fullmatch(r"[A-Za-z0-9_-]{11}", s):
+    if _YT_ID11_RE.fullmatch(s):
         return s
     m = _YT_ID_RE.search(s)
     if m:
@@ -88,6 +93,13 @@ def extract_video_id(url_or_id: str) -> Optional[str]:
 
 
 def parse_int(x: object, default: int = 0) -> int:
+    # fast path: plain ints and plain digit strings (the usual CSV cell)
+    if type(x) is int:
+        return x
+    if type(x) is str:
+        s = x.strip()
+        if s.isdigit() and s.isascii():
+            return int(s)
     try:
         if x is None:
             return default
@@ -102,7 +114,7 @@ def parse_int(x: object, default: int = 0) -> int:
 def parse_duration_iso8601(d: str) -> int:
     # ISO8601: PT#H#M#S
     d = (d or "").strip()
-    m = re.fullmatch(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?", d)
+    m = _ISO_DUR_RE.fullmatch(d)
     if not m:
         return 0
     h = int(m.group(1) or 0)
@@ -111,12 +123,33 @@ def parse_duration_iso8601(d: str) -> int:
     return h * 3600 + mm * 60 + s
 
 
-def safe_casefold(s: object) -> str:
-    return str(s or "").casefold()
+def trie_pattern(words: List[str]) -> str:
+    """
+    Regex source matching any of `words`, factored by common prefix
+    ("abc|abd" -> "ab(?:c|d)"). Python's re has no DFA: a flat alternation is
+    retried branch by branch at every position, the trie form walks each
+    title character only once per position.
+    """
+    trie: dict = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(sub) for ch, sub in node.items() if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # greedy "?" tries the longer alias first
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
 
 
 def normalize_spaces(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 
 def clamp(x: float, lo: float, hi: float) -> float:
@@ -142,6 +175,57 @@ class VideoRow:
     channel_title: str
 
 
+@dataclass
+class PerformerStats:
+    """Running per-performer totals, updated once per clean video."""
+    total_views: int = 0
+    peak_views: int = 0
+    video_count: int = 0
+    total_minutes: float = 0.0
+    total_likes: int = 0
+
+    def add(self, v: VideoRow) -> None:
+        if self.video_count == 0 or v.view_count > self.peak_views:
+            self.peak_views = v.view_count
+        self.total_views += v.view_count
+        self.video_count += 1
+        self.total_minutes += v.duration_sec / 60.0 if v.duration_sec else 0.0
+        self.total_likes += v.like_count
+
+
+@dataclass(frozen=True, eq=False)  # hashed by identity, usable as a cache key
+class AliasMatcher:
+    """
+    All performer aliases as one trie-shaped regex.
+
+    Built from casefolded aliases and run on casefolded titles. Group 1 of
+    a match is the alias found; `canonicals` maps it to the performers it
+    stands for (an alias may be shared by several performers, and a match
+    also implies any shorter alias that is a whole-word prefix of it,
+    e.g. "Повар" inside "Повар Даніл"). Aliases found later in the title,
+    such as "Гіль" inside "Макс Гіль", are reported by the zero-width
+    lookahead at their own position.
+
+    This equals a per-alias IGNORECASE search only for text whose casefold()
+    keeps its length and has no dotless "ı":
+      - "İ" -> "i̇" adds a non-word combining dot that fakes a word boundary;
+      - "ß" -> "ss" changes what an alias can span;
+      - IGNORECASE treats "ı" as "i", casefold() leaves it alone.
+    Titles like that go through `fallback`, the original per-alias
+    (canonical, regex) list; `fold_safe` is False when an alias itself is
+    like that, and then every title does.
+    """
+    pattern: re.Pattern
+    canonicals: Dict[str, FrozenSet[str]]
+    fallback: Tuple[Tuple[str, re.Pattern], ...]
+    fold_safe: bool = True
+
+
+def fold_safe(s: str, s_cf: str) -> bool:
+    """True if matching casefolded `s` equals an IGNORECASE match on `s`."""
+    return len(s_cf) == len(s) and "ı" not in s_cf
+
+
 # ---------- Loaders ----------
 
 def load_exceptions(path: Path) -> Tuple[Set[str], Set[str]]:
@@ -156,59 +240,80 @@ def load_exceptions(path: Path) -> Tuple[Set[str], Set[str]]:
     if not path.exists():
         return excluded_ids, excluded_urls
 
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        excluded_urls.add(line)
-        vid = extract_video_id(line)
-        if vid:
-            excluded_ids.add(vid)
+    with path.open(encoding="utf-8") as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            excluded_urls.add(line)
+            vid = extract_video_id(line)
+            if vid:
+                excluded_ids.add(vid)
 
     return excluded_ids, excluded_urls
 
 
-def load_performers(path: Path) -> List[Tuple[str, re.Pattern]]:
+def load_performers(path: Path) -> AliasMatcher:
     """
     performers.txt format:
       Canonical | alias1 | alias2 | ...
 
     Returns:
-      compiled list of (canonical, regex) for alias matching
+      one AliasMatcher covering every alias of every performer
     """
-    compiled: List[Tuple[str, re.Pattern]] = []
-
-    text = path.read_text(encoding="utf-8").splitlines()
-    for raw in text:
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-
-        parts = [normalize_spaces(p) for p in line.split("|")]
-        parts = [p for p in parts if p]
-        if not parts:
-            continue
-
-        canonical = parts[0]
-        aliases: List[str] = []
-        seen: Set[str] = set()
-
-        for a in [canonical] + parts[1:]:
-            a = normalize_spaces(a)
-            if not a:
-                continue
-            key = safe_casefold(a)
-            if key in seen:
+    # casefolded alias -> canonical names
+    by_alias: Dict[str, Set[str]] = {}
+    # (canonical, alias) as written, first spelling per casefolded alias
+    fallback: List[Tuple[str, re.Pattern]] = []
+    aliases_safe = True
+
+    with path.open(encoding="utf-8") as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line.startswith("#"):
                 continue
-            seen.add(key)
-            aliases.append(a)
 
-        # compile alias regex with word-ish boundaries
-        for alias in aliases:
-            pat = re.compile(rf"(?<!\w){re.escape(alias)}(?!\w)", flags=re.IGNORECASE | re.UNICODE)
-            compiled.append((canonical, pat))
+            parts = [normalize_spaces(p) for p in line.split("|")]
+            parts = [p for p in parts if p]
+            if not parts:
+                continue
 
-    return compiled
+            canonical = parts[0]
+            for a in [canonical] + parts[1:]:
+                a = normalize_spaces(a)
+                if not a:
+                    continue
+                key = a.casefold()
+                aliases_safe = aliases_safe and fold_safe(a, key)
+                names = by_alias.setdefault(key, set())
+                if canonical not in names:
+                    names.add(canonical)
+                    rx = re.compile(rf"(?<!\w){re.escape(a)}(?!\w)", flags=re.IGNORECASE)
+                    fallback.append((canonical, rx))
+
+    if not by_alias:
+        return AliasMatcher(pattern=re.compile(r"(?!)"), canonicals={}, fallback=())
+
+    # The trie prefers the longest alias that fits at a position; shorter
+    # aliases that are whole-word prefixes of it are folded into its
+    # canonical set, which makes one scan equal to searching every alias alone.
+    canonicals: Dict[str, FrozenSet[str]] = {}
+    for key, names in by_alias.items():
+        names = set(names)
+        for other, other_names in by_alias.items():
+            if other != key and key.startswith(other):
+                nxt = key[len(other)]
+                if not (nxt.isalnum() or nxt == "_"):
+                    names |= other_names
+        canonicals[key] = frozenset(names)
+
+    # zero-width lookahead: finditer() tries every position, so aliases that
+    # overlap in the title are all reported. Aliases are casefolded and matched
+    # against casefolded titles, so no per-character IGNORECASE folding.
+    pattern = re.compile(rf"(?=(?<!\w)({trie_pattern(list(by_alias))})(?!\w))")
+    return AliasMatcher(
+        pattern=pattern, canonicals=canonicals, fallback=tuple(fallback), fold_safe=aliases_safe
+    )
 
 
 def load_channels_map(path: Path) -> Dict[str, str]:
@@ -225,23 +330,25 @@ def load_channels_map(path: Path) -> Dict[str, str]:
     if not path.exists():
         return m
 
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        parts = [normalize_spaces(p) for p in line.split("|")]
-        parts = [p for p in parts if p]
-        if len(parts) < 2:
-            continue
-        channel_id = parts[0]
-        performer = parts[1]
-        if channel_id and performer:
-            m[channel_id] = performer
+    with path.open(encoding="utf-8") as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = [normalize_spaces(p) for p in line.split("|")]
+            parts = [p for p in parts if p]
+            if len(parts) < 2:
+                continue
+            channel_id = parts[0]
+            performer = parts[1]
+            if channel_id and performer:
+                m[channel_id] = performer
     return m
 
 
-def read_videos_csv(path: Path) -> List[VideoRow]:
+def read_videos_csv(path: Path) -> Iterator[VideoRow]:
     """
+    Yields rows one at a time, so the input is never held in memory whole.
     Tries to be flexible with column names.
 
     Expected (any of these):
@@ -255,7 +362,6 @@ def read_videos_csv(path: Path) -> List[VideoRow]:
       - channel_id / channelId
       - channel_title / channelTitle
     """
-    rows: List[VideoRow] = []
     with path.open("r", encoding="utf-8-sig", newline="") as f:
         reader = csv.DictReader(f)
         for r in reader:
@@ -267,7 +373,8 @@ def read_videos_csv(path: Path) -> List[VideoRow]:
             if not url and vid:
                 url = f"https://www.youtube.com/watch?v={vid}"
 
-            title = (r.get("title") or "").strip()
+            # normalized once here; matching and the output CSVs share it
+            title = normalize_spaces(r.get("title") or "")
 
             views = parse_int(r.get("view_count") or r.get("views") or r.get("viewCount") or r.get("viewcount") or 0, 0)
             likes = parse_int(r.get("like_count") or r.get("likes") or r.get("likeCount") or r.get("likecount") or 0, 0)
@@ -286,31 +393,81 @@ def read_videos_csv(path: Path) -> List[VideoRow]:
             if not vid:
                 continue
 
-            rows.append(
-                VideoRow(
-                    video_id=vid,
-                    url=url,
-                    title=title,
-                    view_count=views,
-                    like_count=likes,
-                    duration_sec=duration_sec,
-                    published_at=published_at,
-                    channel_id=channel_id,
-                    channel_title=channel_title,
-                )
+            yield VideoRow(
+                video_id=vid,
+                url=url,
+                title=title,
+                view_count=views,
+                like_count=likes,
+                duration_sec=duration_sec,
+                published_at=published_at,
+                channel_id=channel_id,
+                channel_title=channel_title,
             )
-    return rows
 
 
 # ---------- Core logic ----------
 
-def match_performers_in_title(title: str, compiled_aliases: List[Tuple[str, re.Pattern]]) -> Set[str]:
-    t = normalize_spaces(title)
+@lru_cache(maxsize=None)
+def _match_cached(title_cf: str, aliases: AliasMatcher) -> FrozenSet[str]:
+    matched: Set[str] = set()
+    for m in aliases.pattern.finditer(title_cf):
+        matched |= aliases.canonicals[m.group(1)]
+        if len(matched) >= 2:
+            # a second performer already drops the video; stop scanning
+            break
+    return frozenset(matched)
+
+
+def _match_fallback(title: str, aliases: AliasMatcher) -> FrozenSet[str]:
     matched: Set[str] = set()
-    for canonical, rx in compiled_aliases:
-        if rx.search(t):
+    for canonical, rx in aliases.fallback:
+        if canonical not in matched and rx.search(title):
             matched.add(canonical)
-    return matched
+            if len(matched) >= 2:
+                break
+    return frozenset(matched)
+
+
+def match_performers_in_title(title: str, aliases: AliasMatcher) -> FrozenSet[str]:
+    # `title` comes space-normalized from read_videos_csv().
+    title_cf = title.casefold()
+    if not (aliases.fold_safe and fold_safe(title, title_cf)):
+        # "İ", "ß", "ı", ...: casefolding isn't IGNORECASE here, see AliasMatcher
+        return _match_fallback(title, aliases)
+    # Re-uploads and series share titles: identical titles are matched once.
+    return _match_cached(title_cf, aliases)
+
+
+def classify_video(
+    v: VideoRow,
+    excluded_ids: Set[str],
+    excluded_urls: Set[str],
+    aliases: AliasMatcher,
+    channel_owner: Dict[str, str],
+) -> Tuple[Optional[str], str, Optional[FrozenSet[str]]]:
+    """
+    Decides who a video is attributed to. Pure function of its inputs.
+
+    Returns:
+      (performer, attribution, None) for a kept video
+      (None, drop_reason, matched performer set or None) for a dropped one
+    """
+    # exceptions
+    if v.video_id in excluded_ids or v.url in excluded_urls:
+        return None, "exception", None
+
+    matched = match_performers_in_title(v.title, aliases)
+
+    if len(matched) == 1:
+        return next(iter(matched)), "title", None
+    if len(matched) == 0:
+        # fallback to channel->performer map
+        if v.channel_id and v.channel_id in channel_owner:
+            return channel_owner[v.channel_id], "channel_map", None
+        return None, "no_performer_in_title_and_no_channel_map", None
+    # the cached set itself; dropped_row() formats it at write time
+    return None, "multiple_performers_in_title", matched
 
 
 def compute_base_score(total_views: int, peak_views: int, video_count: int, total_minutes: float) -> float:
@@ -322,6 +479,49 @@ def compute_base_score(total_views: int, peak_views: int, video_count: int, tota
     return (W_TOTAL * T) + (W_PEAK * P) + (W_COUNT * V) + (W_MINUTES * D)
 
 
+CLEAN_FIELDS = [
+    "performer", "attribution", "video_id", "url", "title",
+    "view_count", "like_count", "duration_sec", "duration_min",
+    "published_at", "channel_id", "channel_title",
+]
+
+
+def clean_row(v: VideoRow, performer: str, attribution: str) -> tuple:
+    """One videos_clean.csv row, in CLEAN_FIELDS order."""
+    return (
+        performer,
+        attribution,
+        v.video_id,
+        v.url,
+        v.title,
+        v.view_count,
+        v.like_count,
+        v.duration_sec,
+        round(v.duration_sec / 60.0, 3) if v.duration_sec else 0.0,
+        v.published_at,
+        v.channel_id,
+        v.channel_title,
+    )
+
+
+def dropped_row(v: VideoRow, reason: str, matched: Optional[FrozenSet[str]]) -> dict:
+    row = {
+        "video_id": v.video_id,
+        "url": v.url,
+        "title": v.title,
+        "view_count": v.view_count,
+        "like_count": v.like_count,
+        "duration_sec": v.duration_sec,
+        "published_at": v.published_at,
+        "channel_id": v.channel_id,
+        "channel_title": v.channel_title,
+        "drop_reason": reason,
+    }
+    if matched is not None:
+        row["matched_performers"] = "; ".join(sorted(matched))
+    return row
+
+
 def write_csv(path: Path, rows: List[dict]) -> None:
     if not rows:
         path.write_text("", encoding="utf-8")
@@ -336,9 +536,22 @@ def write_csv(path: Path, rows: List[dict]) -> None:
                 seen.add(k)
                 fieldnames.append(k)
 
+    if len(fieldnames) > 1 and all(len(r) == len(fieldnames) for r in rows):
+        # every row has every column: pull the cells out in C
+        write_csv_rows(path, fieldnames, list(map(itemgetter(*fieldnames), rows)))
+    else:
+        write_csv_rows(path, fieldnames, [[r.get(k, "") for k in fieldnames] for r in rows])
+
+
+def write_csv_rows(path: Path, fieldnames: List[str], rows: List[Sequence[object]]) -> None:
+    """Writes rows that are already sequences in `fieldnames` order."""
+    if not rows:
+        path.write_text("", encoding="utf-8")
+        return
+
     with path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        w.writeheader()
+        w = csv.writer(f)
+        w.writerow(fieldnames)
         w.writerows(rows)
 
 
@@ -351,101 +564,36 @@ def main() -> None:
         raise SystemExit(f"Input not found: {INPUT_PERFORMERS}")
 
     excluded_ids, excluded_urls = load_exceptions(INPUT_EXCEPTIONS)
-    compiled_aliases = load_performers(INPUT_PERFORMERS)
+    aliases = load_performers(INPUT_PERFORMERS)
     channel_owner = load_channels_map(INPUT_CHANNELS_MAP)
 
-    videos = read_videos_csv(INPUT_VIDEOS)
-
-    clean_rows: List[dict] = []
-    dropped_rows: List[dict] = []
+    # (row, performer, attribution); written as CLEAN_FIELDS tuples
+    clean: List[Tuple[VideoRow, str, str]] = []
+    # (row, drop_reason, matched_performers); dicts are built only for the CSV
+    dropped: List[Tuple[VideoRow, str, Optional[FrozenSet[str]]]] = []
 
     # Aggregation per performer
-    per_views: Dict[str, List[int]] = {}
-    per_minutes: Dict[str, float] = {}
-    per_likes: Dict[str, int] = {}
+    per_performer: Dict[str, PerformerStats] = {}
 
+    videos_in = 0
     global_views = 0
     global_likes = 0
 
-    for v in videos:
-        # exceptions
-        if v.video_id in excluded_ids or v.url in excluded_urls:
-            dropped_rows.append({
-                "video_id": v.video_id,
-                "url": v.url,
-                "title": v.title,
-                "view_count": v.view_count,
-                "like_count": v.like_count,
-                "duration_sec": v.duration_sec,
-                "published_at": v.published_at,
-                "channel_id": v.channel_id,
-                "channel_title": v.channel_title,
-                "drop_reason": "exception",
-            })
-            continue
+    for v in read_videos_csv(INPUT_VIDEOS):
+        videos_in += 1
 
-        matched = match_performers_in_title(v.title, compiled_aliases)
-
-        performer: Optional[str] = None
-        attribution: str = ""
-
-        if len(matched) == 1:
-            performer = next(iter(matched))
-            attribution = "title"
-        elif len(matched) == 0:
-            # fallback to channel->performer map
-            if v.channel_id and v.channel_id in channel_owner:
-                performer = channel_owner[v.channel_id]
-                attribution = "channel_map"
-            else:
-                dropped_rows.append({
-                    "video_id": v.video_id,
-                    "url": v.url,
-                    "title": v.title,
-                    "view_count": v.view_count,
-                    "like_count": v.like_count,
-                    "duration_sec": v.duration_sec,
-                    "published_at": v.published_at,
-                    "channel_id": v.channel_id,
-                    "channel_title": v.channel_title,
-                    "drop_reason": "no_performer_in_title_and_no_channel_map",
-                })
-                continue
-        else:
-            dropped_rows.append({
-                "video_id": v.video_id,
-                "url": v.url,
-                "title": v.title,
-                "view_count": v.view_count,
-                "like_count": v.like_count,
-                "duration_sec": v.duration_sec,
-                "published_at": v.published_at,
-                "channel_id": v.channel_id,
-                "channel_title": v.channel_title,
-                "drop_reason": "multiple_performers_in_title",
-                "matched_performers": "; ".join(sorted(matched)),
-            })
+        performer, how, matched = classify_video(v, excluded_ids, excluded_urls, aliases, channel_owner)
+        if performer is None:
+            dropped.append((v, how, matched))
             continue
 
         # keep clean
-        clean_rows.append({
-            "performer": performer,
-            "attribution": attribution,
-            "video_id": v.video_id,
-            "url": v.url,
-            "title": v.title,
-            "view_count": v.view_count,
-            "like_count": v.like_count,
-            "duration_sec": v.duration_sec,
-            "duration_min": round(v.duration_sec / 60.0, 3) if v.duration_sec else 0.0,
-            "published_at": v.published_at,
-            "channel_id": v.channel_id,
-            "channel_title": v.channel_title,
-        })
+        clean.append((v, performer, how))
 
-        per_views.setdefault(performer, []).append(v.view_count)
-        per_minutes[performer] = per_minutes.get(performer, 0.0) + (v.duration_sec / 60.0 if v.duration_sec else 0.0)
-        per_likes[performer] = per_likes.get(performer, 0) + v.like_count
+        stats = per_performer.get(performer)
+        if stats is None:
+            stats = per_performer[performer] = PerformerStats()
+        stats.add(v)
 
         global_views += v.view_count
         global_likes += v.like_count
@@ -453,25 +601,29 @@ def main() -> None:
     # Engagement prior mean like-rate
     p0 = (global_likes / global_views) if global_views > 0 else 0.0
     M = SMOOTH_M_VIEWS
+    # loop invariants of the per-performer math
+    prior_likes = M * p0
+    apply_engagement = ENABLE_ENGAGEMENT_MULTIPLIER and p0 > 0
+    eng_lo, eng_hi = ENG_MULT_CLAMP
 
     rating_rows: List[dict] = []
-    for performer, views_list in per_views.items():
-        total_views = sum(views_list)
-        peak_views = max(views_list) if views_list else 0
-        video_count = len(views_list)
-        total_minutes = per_minutes.get(performer, 0.0)
-        total_likes = per_likes.get(performer, 0)
+    for performer, stats in per_performer.items():
+        total_views = stats.total_views
+        peak_views = stats.peak_views
+        video_count = stats.video_count
+        total_minutes = stats.total_minutes
+        total_likes = stats.total_likes
 
         base_score = compute_base_score(total_views, peak_views, video_count, total_minutes)
 
         like_rate = (total_likes / total_views) if total_views > 0 else 0.0
-        like_rate_smooth = ((total_likes + M * p0) / (total_views + M)) if (total_views + M) > 0 else 0.0
+        like_rate_smooth = ((total_likes + prior_likes) / (total_views + M)) if (total_views + M) > 0 else 0.0
 
         eng_mult = 1.0
         score_with_engagement = base_score
-        if ENABLE_ENGAGEMENT_MULTIPLIER and p0 > 0:
+        if apply_engagement:
             eng_mult = 1.0 + 0.5 * ((like_rate_smooth - p0) / p0)
-            eng_mult = clamp(eng_mult, ENG_MULT_CLAMP[0], ENG_MULT_CLAMP[1])
+            eng_mult = clamp(eng_mult, eng_lo, eng_hi)
             score_with_engagement = base_score * eng_mult
 
         rating_rows.append({
@@ -491,19 +643,19 @@ def main() -> None:
         })
 
     sort_key = "score_with_engagement" if ENABLE_ENGAGEMENT_MULTIPLIER else "score"
-    rating_rows.sort(key=lambda r: r[sort_key], reverse=True)
+    rating_rows.sort(key=itemgetter(sort_key), reverse=True)
 
     for i, r in enumerate(rating_rows, start=1):
         r["rank"] = i
 
     # Write outputs
-    write_csv(OUT_CLEAN, clean_rows)
-    write_csv(OUT_DROPPED, dropped_rows)
+    write_csv_rows(OUT_CLEAN, CLEAN_FIELDS, [clean_row(*c) for c in clean])
+    write_csv(OUT_DROPPED, [dropped_row(*d) for d in dropped])
     write_csv(OUT_RATING, rating_rows)
 
-    print(f"OK: videos in: {len(videos)}")
-    print(f"OK: clean (rated): {len(clean_rows)} -> {OUT_CLEAN}")
-    print(f"OK: dropped: {len(dropped_rows)} -> {OUT_DROPPED}")
+    print(f"OK: videos in: {videos_in}")
+    print(f"OK: clean (rated): {len(clean)} -> {OUT_CLEAN}")
+    print(f"OK: dropped: {len(dropped)} -> {OUT_DROPPED}")
     print(f"OK: rating rows: {len(rating_rows)} -> {OUT_RATING}")
     if global_views > 0:
         print(f"OK: global like rate (p0): {p0*100:.3f}% (M={M})")
@@ -1,20 +1,111 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
 import subprocess
 import sys
+import time
+from pathlib import Path
 
-def run(cmd):
-    print(f"\n==> {' '.join(cmd)}")
-    r = subprocess.run(cmd, check=False)
-    if r.returncode != 0:
-        raise SystemExit(r.returncode)
+# Make-like staleness: a stage is skipped when its last-written output is
+# newer than every input (data files and the stage's own script).
+RATE_SOURCES = [
+    Path("out/filtered_videos.csv"),
+    Path("performers.txt"),
+    Path("channels_map.txt"),
+    Path("exceptions.txt"),
+    Path("scripts/rate.py"),
+]
+RATE_TARGET = Path("out/rating.csv")
+
+EXPORT_SOURCES = [
+    Path("out/rating.csv"),
+    Path("out/videos_clean.csv"),
+    Path("scripts/export_json.py"),
+]
+EXPORT_TARGET = Path("docs/data/rating.json")
+
+def stale(target, sources):
+    if not target.exists():
+        return True
+    t = target.stat().st_mtime
+    return any(s.exists() and s.stat().st_mtime > t for s in sources)
+
+# Stage DAG: (name, dependencies). Stages whose dependencies are all done
+# are launched together; today the chain is linear, but per-channel
+# fetchers or extra exporters can fan out here without restructuring.
+STAGES = [
+    ("fetch", None),
+    ("rate", ["fetch"]),
+    ("export_json", ["rate"]),
+]
+
+POLL_SEC = 0.1
+
+def run_stages(stages, should_run):
+    done = set()
+    pending = list(stages)
+    running = {}  # name -> Popen
+    while pending or running:
+        # Skipped stages finish instantly and may unblock stages seen
+        # earlier in the pass, so rescan until a pass changes nothing.
+        progress = True
+        while progress:
+            progress = False
+            for stage in list(pending):
+                name, deps = stage
+                if not all(d in done for d in deps or ()):
+                    continue
+                pending.remove(stage)
+                progress = True
+                if not should_run(name):
+                    done.add(name)
+                    continue
+                cmd = [sys.executable, f"scripts/{name}.py"]
+                print(f"\n==> {' '.join(cmd)}")
+                running[name] = subprocess.Popen(cmd)
+        if not running:
+            if pending:
+                raise SystemExit(f"Unresolvable stage dependencies: {[n for n, _ in pending]}")
+            break
+        time.sleep(POLL_SEC)
+        for name, proc in list(running.items()):
+            rc = proc.poll()
+            if rc is None:
+                continue
+            del running[name]
+            if rc != 0:
+                for other in running.values():
+                    other.terminate()
+                for other in running.values():
+                    other.wait()
+                raise SystemExit(rc)
+            done.add(name)
 
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--skip-fetch", action="store_true",
+                    help="reuse out/filtered_videos.csv instead of calling the YouTube API")
+    ap.add_argument("--force", action="store_true",
+                    help="run every stage even if its outputs are up to date")
+    args = ap.parse_args()
+
+    checks = {
+        "rate": (RATE_TARGET, RATE_SOURCES),
+        "export_json": (EXPORT_TARGET, EXPORT_SOURCES),
+    }
+
+    def should_run(name):
+        if name == "fetch":
+            return not args.skip_fetch
+        target, sources = checks[name]
+        if args.force or stale(target, sources):
+            return True
+        print(f"\n==> {name}.py: {target} is up to date, skipping")
+        return False
+
     # Run in repo root
-    run([sys.executable, "scripts/fetch.py"])
-    run([sys.executable, "scripts/rate.py"])
-    run([sys.executable, "scripts/export_json.py"])
+    run_stages(STAGES, should_run)
     print("\n✅ Pipeline finished")
 
 if __name__ == "__main__":